@@ -2,9 +2,11 @@
 
 from .fred import TimeSeriesPoint
 from .sample_series import get_gold_series, get_sp500_series
+from .synthetic_series import generate_series
 
 __all__ = [
     "TimeSeriesPoint",
+    "generate_series",
     "get_gold_series",
     "get_sp500_series",
 ]
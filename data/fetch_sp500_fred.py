@@ -72,6 +72,9 @@ def fetch_observations(
     start_date: str,
     end_date: str,
     frequency: str = "d",
+    *,
+    base_url: str = FRED_BASE_URL,
+    timeout: float = 30,
 ) -> Sequence[Mapping[str, str]]:
     params = {
         "series_id": series_id,
@@ -83,7 +86,7 @@ def fetch_observations(
         "sort_order": "asc",
     }
 
-    response = requests.get(FRED_BASE_URL, params=params, timeout=30)
+    response = requests.get(base_url, params=params, timeout=timeout)
     response.raise_for_status()
     payload = response.json()
     observations = payload.get("observations", [])
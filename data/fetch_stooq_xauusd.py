@@ -25,8 +25,8 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def fetch_csv_rows(url: str) -> list[dict[str, str]]:
-    response = requests.get(url, timeout=30)
+def fetch_csv_rows(url: str, *, timeout: float = 30) -> list[dict[str, str]]:
+    response = requests.get(url, timeout=timeout)
     response.raise_for_status()
     response.encoding = "utf-8"
 
@@ -50,7 +50,7 @@ def ensure_destination(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
 
-def write_json(path: Path, rows: Iterable[dict[str, str]]) -> None:
+def write_json(path: Path, rows: Iterable[dict[str, str]], url: str = STOOQ_CSV_URL) -> None:
     import json
 
     ensure_destination(path)
@@ -58,7 +58,7 @@ def write_json(path: Path, rows: Iterable[dict[str, str]]) -> None:
         "series_id": "XAUUSD_STOOQ",
         "observations": list(rows),
         "source": "Stooq XAUUSD daily csv",
-        "url": STOOQ_CSV_URL,
+        "url": url,
     }
     with path.open("w", encoding="utf-8") as fh:
         json.dump(payload, fh, indent=2)
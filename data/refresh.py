@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""
+Refresh every configured data source concurrently and publish the results.
+
+Each source is fetched on its own thread with a per-request timeout, a bounded
+number of retries and an overall per-source deadline. Results are validated
+(strictly increasing dates, finite values, no implausible jumps) and staged
+next to the published files. The staged files only replace the published
+series when every required source succeeded. Each file is replaced atomically,
+one after another, so a reader may briefly see a mix of old and new files.
+
+Usage:
+    FRED_API_KEY=your_key python -m data.refresh --output-dir frontend/public/data
+
+Source URLs can be overridden (e.g. to point at local stub servers) with
+--fred-url and --stooq-url.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Callable, Mapping, Sequence
+
+from data.fetch_sp500_fred import FRED_BASE_URL, fetch_observations
+from data.fetch_sp500_fred import write_json as write_fred_json
+from data.fetch_stooq_xauusd import STOOQ_CSV_URL, fetch_csv_rows
+from data.fetch_stooq_xauusd import write_json as write_stooq_json
+
+Observation = Mapping[str, object]
+
+
+@dataclass(frozen=True)
+class SourceSpec:
+    """Configuration for a single refreshable data source."""
+
+    name: str
+    filename: str
+    fetch: Callable[[float], Sequence[Observation]]
+    write: Callable[[Path, Sequence[Observation]], None]
+    required: bool = True
+    max_jump: float = 1.0
+
+
+@dataclass
+class SourceResult:
+    """Outcome of fetching and validating a single source."""
+
+    spec: SourceSpec
+    rows: Sequence[Observation] | None
+    attempts: int
+    elapsed: float
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=Path("frontend/public/data"),
+        help="Directory holding the published series (default: frontend/public/data)",
+    )
+    parser.add_argument(
+        "--api-key",
+        default=os.environ.get("FRED_API_KEY"),
+        help="FRED API key (defaults to environment variable FRED_API_KEY)",
+    )
+    parser.add_argument(
+        "--fred-url",
+        default=FRED_BASE_URL,
+        help="FRED observations endpoint (default: public FRED API)",
+    )
+    parser.add_argument(
+        "--fred-series-id",
+        default="SP500",
+        help="FRED series identifier (default: SP500)",
+    )
+    parser.add_argument(
+        "--fred-start-date",
+        default="1970-01-01",
+        help="ISO start date for FRED observations (default: 1970-01-01)",
+    )
+    parser.add_argument(
+        "--stooq-url",
+        default=STOOQ_CSV_URL,
+        help="Stooq XAUUSD CSV endpoint (default: public Stooq export)",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=30.0,
+        help="Per-request timeout in seconds (default: 30)",
+    )
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        default=120.0,
+        help="Total seconds allowed per source, across retries (default: 120)",
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=2,
+        help="Retries per source after the first attempt (default: 2)",
+    )
+    parser.add_argument(
+        "--backoff",
+        type=float,
+        default=1.0,
+        help="Base delay in seconds between retries, doubled each attempt (default: 1)",
+    )
+    return parser.parse_args()
+
+
+def build_sources(args: argparse.Namespace) -> list[SourceSpec]:
+    """Return the configured sources in publish order."""
+
+    def fetch_fred(timeout: float) -> Sequence[Observation]:
+        if not args.api_key:
+            raise ValueError("FRED API key not provided. Set FRED_API_KEY or pass --api-key.")
+        return fetch_observations(
+            api_key=args.api_key,
+            series_id=args.fred_series_id,
+            start_date=args.fred_start_date,
+            end_date=date.today().isoformat(),
+            base_url=args.fred_url,
+            timeout=timeout,
+        )
+
+    def fetch_stooq(timeout: float) -> Sequence[Observation]:
+        return fetch_csv_rows(args.stooq_url, timeout=timeout)
+
+    return [
+        SourceSpec(
+            name=args.fred_series_id,
+            filename="sp500.json",
+            fetch=fetch_fred,
+            write=lambda path, rows: write_fred_json(path, rows, args.fred_series_id),
+        ),
+        SourceSpec(
+            name="XAUUSD_STOOQ",
+            filename="xauusd.json",
+            fetch=fetch_stooq,
+            write=lambda path, rows: write_stooq_json(path, rows, url=args.stooq_url),
+        ),
+    ]
+
+
+def validate_observations(rows: Sequence[Observation], *, max_jump: float) -> list[str]:
+    """Return a list of problems found in ``rows`` (empty when the series is sane).
+
+    Values must be finite and positive, as all configured sources are prices.
+    ``max_jump`` bounds the relative move between consecutive observations in
+    either direction, e.g. ``1.0`` rejects any step that more than doubles or
+    halves the value.
+    """
+
+    if not rows:
+        return ["no observations"]
+
+    problems: list[str] = []
+    previous_date: str | None = None
+    previous_value: float | None = None
+
+    for row in rows:
+        date_str = str(row.get("date", ""))
+        try:
+            date.fromisoformat(date_str)
+            value = float(row["value"])  # type: ignore[arg-type]
+        except (KeyError, TypeError, ValueError):
+            problems.append(f"{date_str or '?'}: unparseable observation {dict(row)!r}")
+            previous_value = None
+            continue
+
+        if previous_date is not None and date_str <= previous_date:
+            problems.append(f"{date_str}: date not after previous {previous_date}")
+        previous_date = date_str
+
+        if not math.isfinite(value) or value <= 0:
+            problems.append(f"{date_str}: invalid value {value}")
+            previous_value = None
+            continue
+
+        if previous_value is not None:
+            ratio = value / previous_value
+            change = max(ratio, 1 / ratio) - 1
+            if change > max_jump:
+                problems.append(
+                    f"{date_str}: jump of {change:.0%} from {previous_value} to {value}"
+                )
+        previous_value = value
+
+    return problems
+
+
+def fetch_with_retries(
+    spec: SourceSpec,
+    *,
+    timeout: float,
+    retries: int,
+    backoff: float,
+    deadline: float = math.inf,
+    on_attempt: Callable[[int], None] | None = None,
+) -> SourceResult:
+    """Fetch and validate ``spec``, retrying failed fetches with exponential backoff.
+
+    ``deadline`` is the total budget in seconds across all attempts and backoff
+    sleeps: no retry starts after it, and each request's socket timeout is
+    capped at the time remaining. That is not a hard bound, since ``requests``
+    applies the timeout per socket operation and a server trickling bytes can
+    run past it; :func:`refresh` enforces the deadline by abandoning the
+    source's thread.
+    Validation failures are returned immediately since a re-fetch would most
+    likely return the same payload.
+    """
+
+    started = time.perf_counter()
+    expires = started + deadline
+    error: str | None = None
+    attempt = 0
+
+    for attempt in range(1, retries + 2):
+        remaining = expires - time.perf_counter()
+        if on_attempt is not None:
+            on_attempt(attempt)
+        try:
+            rows = spec.fetch(min(timeout, remaining))
+        except Exception as exc:
+            error = f"{type(exc).__name__}: {exc}"
+        else:
+            elapsed = time.perf_counter() - started
+            problems = validate_observations(rows, max_jump=spec.max_jump)
+            if not problems:
+                return SourceResult(spec, rows, attempt, elapsed)
+            shown = "; ".join(problems[:3])
+            more = f" (+{len(problems) - 3} more)" if len(problems) > 3 else ""
+            return SourceResult(spec, None, attempt, elapsed, f"validation failed: {shown}{more}")
+
+        if attempt > retries:
+            break
+        delay = backoff * 2 ** (attempt - 1)
+        if time.perf_counter() + delay >= expires:
+            error = f"timed out: deadline of {deadline:g}s reached after {error}"
+            break
+        time.sleep(delay)
+
+    return SourceResult(spec, None, attempt, time.perf_counter() - started, error)
+
+
+def refresh(
+    sources: Sequence[SourceSpec],
+    output_dir: Path,
+    *,
+    timeout: float = 30.0,
+    retries: int = 2,
+    backoff: float = 1.0,
+    deadline: float = 120.0,
+) -> tuple[list[SourceResult], bool]:
+    """Fetch all ``sources`` concurrently and publish them into ``output_dir``.
+
+    Each source gets at most ``deadline`` seconds in total; a source still
+    running after that is reported as timed out. Returns the per-source results
+    and whether anything was published. Nothing is written to the published
+    files unless every required source succeeded; optional sources that fail
+    keep their previously published version.
+    """
+
+    outcomes: list[SourceResult | None] = [None] * len(sources)
+    attempts = [0] * len(sources)
+
+    def run(index: int, spec: SourceSpec) -> None:
+        def record(attempt: int) -> None:
+            attempts[index] = attempt
+
+        outcomes[index] = fetch_with_retries(
+            spec,
+            timeout=timeout,
+            retries=retries,
+            backoff=backoff,
+            deadline=deadline,
+            on_attempt=record,
+        )
+
+    # Daemon threads rather than an executor: a source stuck past its deadline
+    # (e.g. a server trickling bytes under the socket timeout) is abandoned
+    # instead of keeping the process alive until it finishes.
+    started = time.perf_counter()
+    threads = [
+        threading.Thread(target=run, args=(index, spec), name=f"refresh-{spec.name}", daemon=True)
+        for index, spec in enumerate(sources)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(max(0.0, started + deadline - time.perf_counter()))
+
+    results: list[SourceResult] = []
+    for index, spec in enumerate(sources):
+        result = outcomes[index]
+        if result is None:
+            result = SourceResult(
+                spec,
+                None,
+                attempts[index],
+                time.perf_counter() - started,
+                f"timed out: no result within {deadline:g}s",
+            )
+        results.append(result)
+
+    if any(not result.ok and result.spec.required for result in results):
+        return results, False
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    # Stage inside the destination directory so the final os.replace calls are
+    # same-filesystem renames. Each file is swapped atomically, but the files
+    # are replaced one after another, not as a single transaction.
+    staging = Path(tempfile.mkdtemp(prefix=".refresh-", dir=output_dir))
+    try:
+        staged: list[tuple[Path, Path]] = []
+        for result in results:
+            if not result.ok:
+                continue
+            path = staging / result.spec.filename
+            result.spec.write(path, result.rows)  # type: ignore[arg-type]
+            staged.append((path, output_dir / result.spec.filename))
+
+        for source_path, target_path in staged:
+            os.replace(source_path, target_path)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+    return results, True
+
+
+def format_report(results: Sequence[SourceResult]) -> str:
+    """Render a per-source timing table."""
+
+    lines = []
+    for result in results:
+        status = "ok" if result.ok else ("FAILED" if result.spec.required else "skipped")
+        count = len(result.rows) if result.rows is not None else 0
+        line = (
+            f"{result.spec.name:<14} {status:<7} {result.elapsed:7.2f}s "
+            f"attempts={result.attempts} observations={count}"
+        )
+        if result.error:
+            line += f" error={result.error}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def main() -> int:
+    args = parse_args()
+    sources = build_sources(args)
+
+    started = time.perf_counter()
+    results, published = refresh(
+        sources,
+        args.output_dir,
+        timeout=args.timeout,
+        retries=args.retries,
+        backoff=args.backoff,
+        deadline=args.deadline,
+    )
+    elapsed = time.perf_counter() - started
+
+    print(format_report(results))
+    if not published:
+        print(
+            f"Refresh aborted after {elapsed:.2f}s: a required source failed; "
+            f"{args.output_dir} left unchanged.",
+            file=sys.stderr,
+        )
+        return 1
+
+    print(f"Published {sum(r.ok for r in results)} series to {args.output_dir} in {elapsed:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,61 @@
+"""Series loaded from the JSON snapshots committed under ``frontend/public/data``."""
+
+from __future__ import annotations
+
+import json
+from datetime import date
+from functools import cache
+from pathlib import Path
+from typing import List
+
+from .fred import TimeSeriesPoint
+
+SNAPSHOT_DIR = Path(__file__).resolve().parent.parent / "frontend" / "public" / "data"
+
+
+def load_snapshot(path: Path) -> List[TimeSeriesPoint]:
+    """Read a ``{"observations": [{"date", "value"}, ...]}`` snapshot file.
+
+    Missing files yield an empty series so endpoints degrade to empty responses
+    instead of failing at import time.
+    """
+
+    if not path.exists():
+        return []
+
+    with path.open(encoding="utf-8") as fh:
+        payload = json.load(fh)
+
+    points: List[TimeSeriesPoint] = []
+    for observation in payload.get("observations", []):
+        try:
+            points.append(
+                TimeSeriesPoint(
+                    timestamp=date.fromisoformat(observation["date"]),
+                    value=float(observation["value"]),
+                )
+            )
+        except (KeyError, TypeError, ValueError):
+            continue
+    return points
+
+
+@cache
+def get_sp500_series() -> List[TimeSeriesPoint]:
+    """Return the S&P 500 (FRED ``SP500``) daily closes."""
+
+    return load_snapshot(SNAPSHOT_DIR / "sp500.json")
+
+
+@cache
+def get_gold_series() -> List[TimeSeriesPoint]:
+    """Return gold spot (Stooq ``XAUUSD``) closes in USD per troy ounce."""
+
+    return load_snapshot(SNAPSHOT_DIR / "xauusd.json")
+
+
+@cache
+def get_usd_chf_series() -> List[TimeSeriesPoint]:
+    """Return USD/CHF rates; empty until a ``usdchf.json`` snapshot is published."""
+
+    return load_snapshot(SNAPSHOT_DIR / "usdchf.json")
@@ -0,0 +1,40 @@
+"""Deterministic synthetic time series for load testing and local experiments."""
+
+from __future__ import annotations
+
+import math
+import random
+from datetime import date, timedelta
+from typing import List
+
+from .fred import TimeSeriesPoint
+
+
+def generate_series(
+    points: int,
+    *,
+    initial: float,
+    start: date = date(1970, 1, 1),
+    drift: float = 0.0002,
+    volatility: float = 0.01,
+    seed: int = 0,
+) -> List[TimeSeriesPoint]:
+    """Return ``points`` daily observations following a geometric random walk.
+
+    The same ``seed`` always yields the same series, and series generated with
+    the same ``start`` and ``points`` share timestamps so they can be combined
+    into ratios without dropping observations.
+    """
+
+    if points < 0:
+        raise ValueError("points must be non-negative")
+
+    rng = random.Random(seed)
+    value = initial
+    series: List[TimeSeriesPoint] = []
+
+    for offset in range(points):
+        series.append(TimeSeriesPoint(timestamp=start + timedelta(days=offset), value=value))
+        value *= math.exp(drift + volatility * rng.gauss(0.0, 1.0))
+
+    return series
@@ -0,0 +1,721 @@
+#!/usr/bin/env python3
+"""
+Load-test harness for the Measure in Goods API.
+
+Starts ``src.backend.app:app`` under uvicorn with synthetic series of a chosen
+size, drives it with a weighted mix of ``/ratios/*``, ``/metadata/capabilities``
+and ``/basket/compute`` requests from concurrent clients, and reports
+throughput, p50/p95/p99 latency, peak resident memory per worker and client CPU
+use for every combination of worker count and loader cache setting.
+
+Usage:
+    python -m src.backend.loadtest --workers 1,2,4 --loader-cache on,off \\
+        --points 20000 --concurrency 16 --duration 20
+
+The synthetic series are written as JSON snapshots and served through the
+app's own loaders in ``data.sample_series``. ``--loader-cache on`` keeps their
+``functools.cache``; ``off`` calls ``load_snapshot`` on every request, so each
+request rereads and parses the snapshot files.
+
+``/basket/compute`` is not implemented yet and always answers 500, which also
+drops the keep-alive connection, so it is left out of the default mix.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import IO, Sequence
+
+from fastapi import FastAPI
+
+from data import sample_series
+from data.synthetic_series import generate_series
+
+from . import pricing
+
+POINTS_ENV = "MIG_LOADTEST_POINTS"
+SNAPSHOT_DIR_ENV = "MIG_LOADTEST_SNAPSHOT_DIR"
+LOADER_CACHE_ENV = "MIG_LOADTEST_LOADER_CACHE"
+LOADER_CACHE_MODES = ("on", "off")
+# Client CPU, in cores per client process, above which the load generator
+# rather than the server is likely the bottleneck.
+CLIENT_SATURATION = 0.8
+REQUEST_KINDS = ("ratios", "capabilities", "basket")
+DEFAULT_MIX = "ratios=80,capabilities=20"
+
+RATIO_PATHS = (
+    "/ratios/sp500-gold",
+    "/ratios/sp500-usd",
+    "/ratios/sp500-chf",
+    "/ratios/gold-usd",
+    "/ratios/gold-usd-kg",
+    "/ratios/gold-usd-gram",
+)
+BASKET_PAYLOAD = {
+    "assets": [
+        {"source": "FRED", "series_id": "SP500", "weight": 0.6},
+        {"source": "STOOQ", "series_id": "XAUUSD", "weight": 0.4},
+    ],
+    "base_currency": "USD",
+}
+
+
+# Snapshot file, sample_series loader name, and random-walk parameters.
+SYNTHETIC_SNAPSHOTS = (
+    ("sp500.json", "get_sp500_series", {"initial": 90.0, "volatility": 0.011, "seed": 1}),
+    ("xauusd.json", "get_gold_series", {"initial": 35.0, "volatility": 0.012, "seed": 2}),
+    ("usdchf.json", "get_usd_chf_series", {"initial": 4.3, "volatility": 0.005, "seed": 3}),
+)
+
+
+def write_synthetic_snapshots(directory: Path, points: int) -> None:
+    """Write synthetic series of ``points`` observations in the snapshot format."""
+
+    directory.mkdir(parents=True, exist_ok=True)
+    for filename, _, params in SYNTHETIC_SNAPSHOTS:
+        observations = [
+            {"date": point.timestamp.isoformat(), "value": point.value}
+            for point in generate_series(points, **params)
+        ]
+        with (directory / filename).open("w", encoding="utf-8") as fh:
+            json.dump({"observations": observations}, fh)
+
+
+def install_snapshot_loaders(snapshot_dir: Path, *, loader_cache: str) -> None:
+    """Serve ``snapshot_dir`` through the app's loaders, with or without their cache."""
+
+    if loader_cache not in LOADER_CACHE_MODES:
+        raise ValueError(f"Unknown loader cache mode {loader_cache!r}; expected one of {LOADER_CACHE_MODES}")
+
+    sample_series.SNAPSHOT_DIR = snapshot_dir
+    for _, name, _ in SYNTHETIC_SNAPSHOTS:
+        cached = getattr(sample_series, name)
+        cached.cache_clear()
+        setattr(pricing, name, cached if loader_cache == "on" else cached.__wrapped__)
+
+
+def create_app() -> FastAPI:
+    """uvicorn factory that configures synthetic data from the environment.
+
+    Uses the snapshots in ``MIG_LOADTEST_SNAPSHOT_DIR`` when set, otherwise
+    writes ``MIG_LOADTEST_POINTS`` observations into a fresh temporary directory.
+    """
+
+    from .app import app
+
+    snapshot_dir = os.environ.get(SNAPSHOT_DIR_ENV)
+    if snapshot_dir is None:
+        snapshot_dir = tempfile.mkdtemp(prefix="mig-loadtest-")
+        write_synthetic_snapshots(Path(snapshot_dir), int(os.environ.get(POINTS_ENV, "5000")))
+
+    install_snapshot_loaders(Path(snapshot_dir), loader_cache=os.environ.get(LOADER_CACHE_ENV, "on"))
+    return app
+
+
+@dataclass
+class Sample:
+    """Single request observation recorded by a client thread."""
+
+    kind: str
+    latency: float
+    status: int
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 400
+
+
+@dataclass
+class RunResult:
+    """Aggregated metrics for one worker/loader-cache configuration."""
+
+    workers: int
+    loader_cache: str
+    points: int
+    concurrency: int
+    client_processes: int
+    duration: float
+    requests: int
+    errors: int
+    throughput: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    client_cpu_seconds: float = 0.0
+    client_cpu_peak: float = 0.0
+    worker_rss_mb: list[float] = field(default_factory=list)
+    by_kind: dict[str, dict[str, float]] = field(default_factory=dict)
+    statuses: dict[str, dict[int, int]] = field(default_factory=dict)
+
+
+def parse_mix(text: str) -> dict[str, float]:
+    """Parse ``ratios=80,capabilities=20`` into normalized weights.
+
+    Kinds with a zero weight are dropped from the result.
+    """
+
+    weights: dict[str, float] = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in REQUEST_KINDS:
+            raise argparse.ArgumentTypeError(f"Unknown request kind {name!r} in mix")
+        try:
+            weights[name] = float(weight)
+        except ValueError as exc:
+            raise argparse.ArgumentTypeError(f"Invalid weight for {name!r}: {weight!r}") from exc
+        if weights[name] < 0:
+            raise argparse.ArgumentTypeError(f"Negative weight for {name!r}: {weight!r}")
+    total = sum(weights.values())
+    if total <= 0:
+        raise argparse.ArgumentTypeError("Mix weights must sum to a positive number")
+    return {name: weight / total for name, weight in weights.items() if weight > 0}
+
+
+def parse_int_list(text: str) -> list[int]:
+    return [int(part) for part in text.split(",") if part.strip()]
+
+
+def parse_loader_cache_modes(text: str) -> list[str]:
+    modes = [part.strip() for part in text.split(",") if part.strip()]
+    for mode in modes:
+        if mode not in LOADER_CACHE_MODES:
+            raise argparse.ArgumentTypeError(
+                f"Unknown loader cache mode {mode!r}; expected one of {LOADER_CACHE_MODES}"
+            )
+    return modes
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--workers",
+        type=parse_int_list,
+        default=[1],
+        help="Comma-separated uvicorn worker counts to compare (default: 1)",
+    )
+    parser.add_argument(
+        "--loader-cache",
+        type=parse_loader_cache_modes,
+        default=["on"],
+        help=(
+            "Comma-separated settings for the app's snapshot loader cache to compare: "
+            "on (parsed once per worker) or off (reread on every request) (default: on)"
+        ),
+    )
+    parser.add_argument(
+        "--points",
+        type=int,
+        default=5000,
+        help="Observations per synthetic series (default: 5000)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Number of concurrent client connections (default: 8)",
+    )
+    parser.add_argument(
+        "--client-processes",
+        type=int,
+        default=1,
+        help="Processes to spread the client connections over (default: 1)",
+    )
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=10.0,
+        help="Measured seconds per configuration (default: 10)",
+    )
+    parser.add_argument(
+        "--warmup",
+        type=float,
+        default=2.0,
+        help="Unmeasured warm-up seconds per configuration (default: 2)",
+    )
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default=parse_mix(DEFAULT_MIX),
+        help=(
+            f"Request mix weights over {', '.join(REQUEST_KINDS)} (default: {DEFAULT_MIX}; "
+            "basket is not implemented and always fails)"
+        ),
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Seed for the client request sequence (default: 0)",
+    )
+    parser.add_argument(
+        "--server-log",
+        type=Path,
+        default=None,
+        help="Append uvicorn output (including tracebacks) to this file (default: discard)",
+    )
+    parser.add_argument(
+        "--json",
+        type=Path,
+        default=None,
+        help="Optional path to write the full results as JSON",
+    )
+    return parser.parse_args()
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(
+    port: int,
+    *,
+    workers: int,
+    loader_cache: str,
+    snapshot_dir: Path,
+    log: IO[bytes] | None = None,
+) -> subprocess.Popen:
+    env = dict(os.environ, **{SNAPSHOT_DIR_ENV: str(snapshot_dir), LOADER_CACHE_ENV: loader_cache})
+    command = [
+        sys.executable,
+        "-m",
+        "uvicorn",
+        "src.backend.loadtest:create_app",
+        "--factory",
+        "--host",
+        "127.0.0.1",
+        "--port",
+        str(port),
+        "--workers",
+        str(workers),
+        "--log-level",
+        "warning",
+        "--no-access-log",
+    ]
+    output = log if log is not None else subprocess.DEVNULL
+    return subprocess.Popen(command, env=env, stdout=output, stderr=subprocess.STDOUT)
+
+
+def wait_until_ready(base_url: str, process: subprocess.Popen, timeout: float = 30.0) -> None:
+    import requests
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"uvicorn exited with status {process.returncode}")
+        try:
+            if requests.get(f"{base_url}/health", timeout=1).ok:
+                return
+        except requests.RequestException:
+            pass
+        time.sleep(0.1)
+    raise RuntimeError(f"Server at {base_url} not ready after {timeout:.0f}s")
+
+
+def basket_is_implemented(base_url: str) -> bool:
+    """Probe ``/basket/compute`` once; a 5xx means the endpoint cannot serve yet."""
+
+    import requests
+
+    try:
+        response = requests.post(f"{base_url}/basket/compute", json=BASKET_PAYLOAD, timeout=60)
+    except requests.RequestException:
+        return False
+    return response.status_code < 500
+
+
+def read_rss_mb(pid: int) -> float | None:
+    """Return the resident set size of ``pid`` in MiB (Linux ``/proc`` only)."""
+
+    try:
+        with open(f"/proc/{pid}/status", encoding="ascii") as fh:
+            for line in fh:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        return None
+    return None
+
+
+def child_pids(pid: int) -> list[int]:
+    children: list[int] = []
+    try:
+        for task in os.listdir(f"/proc/{pid}/task"):
+            with open(f"/proc/{pid}/task/{task}/children", encoding="ascii") as fh:
+                children.extend(int(child) for child in fh.read().split())
+    except OSError:
+        pass
+    return children
+
+
+def worker_pids(server_pid: int, workers: int) -> list[int]:
+    """Return the processes serving requests for a uvicorn server."""
+
+    if workers <= 1:
+        return [server_pid]
+    # With --workers, the parent supervises and spawns the request-serving
+    # processes; skip helpers such as the multiprocessing resource tracker.
+    children = child_pids(server_pid)
+    workers_only = []
+    for pid in children:
+        try:
+            with open(f"/proc/{pid}/cmdline", "rb") as fh:
+                if b"spawn_main" in fh.read():
+                    workers_only.append(pid)
+        except OSError:
+            continue
+    return workers_only or children
+
+
+class MemorySampler(threading.Thread):
+    """Background thread recording peak RSS of the worker processes."""
+
+    def __init__(self, server_pid: int, workers: int, interval: float = 0.25) -> None:
+        super().__init__(daemon=True)
+        self.server_pid = server_pid
+        self.workers = workers
+        self.interval = interval
+        self.peaks: dict[int, float] = {}
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.is_set():
+            for pid in worker_pids(self.server_pid, self.workers):
+                rss = read_rss_mb(pid)
+                if rss is not None:
+                    self.peaks[pid] = max(rss, self.peaks.get(pid, 0.0))
+            self._stop_event.wait(self.interval)
+
+    def stop(self) -> list[float]:
+        self._stop_event.set()
+        self.join()
+        return sorted(self.peaks.values(), reverse=True)
+
+
+def drive(
+    base_url: str,
+    *,
+    mix: dict[str, float],
+    concurrency: int,
+    duration: float,
+    seed: int,
+    first_client: int = 0,
+) -> list[Sample]:
+    """Issue requests from ``concurrency`` threads for ``duration`` seconds."""
+
+    import requests
+
+    kinds = list(mix)
+    weights = [mix[kind] for kind in kinds]
+    deadline = time.perf_counter() + duration
+    samples: list[Sample] = []
+    lock = threading.Lock()
+
+    def client(index: int) -> None:
+        rng = random.Random(seed * 1000 + index)
+        local: list[Sample] = []
+        with requests.Session() as session:
+            while time.perf_counter() < deadline:
+                kind = rng.choices(kinds, weights)[0]
+                started = time.perf_counter()
+                try:
+                    if kind == "ratios":
+                        response = session.get(base_url + rng.choice(RATIO_PATHS), timeout=60)
+                    elif kind == "capabilities":
+                        response = session.get(f"{base_url}/metadata/capabilities", timeout=60)
+                    else:
+                        response = session.post(f"{base_url}/basket/compute", json=BASKET_PAYLOAD, timeout=60)
+                    status = response.status_code
+                except requests.RequestException:
+                    status = 0
+                local.append(Sample(kind, time.perf_counter() - started, status))
+        with lock:
+            samples.extend(local)
+
+    threads = [
+        threading.Thread(target=client, args=(first_client + index,))
+        for index in range(concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return samples
+
+
+def drive_process(
+    base_url: str,
+    mix: dict[str, float],
+    concurrency: int,
+    duration: float,
+    seed: int,
+    first_client: int,
+) -> tuple[list[Sample], float, float]:
+    """Run :func:`drive` and return its samples, CPU seconds and wall seconds."""
+
+    cpu_started = time.process_time()
+    started = time.perf_counter()
+    samples = drive(
+        base_url,
+        mix=mix,
+        concurrency=concurrency,
+        duration=duration,
+        seed=seed,
+        first_client=first_client,
+    )
+    return samples, time.process_time() - cpu_started, time.perf_counter() - started
+
+
+def drive_clients(
+    base_url: str,
+    *,
+    mix: dict[str, float],
+    concurrency: int,
+    duration: float,
+    seed: int,
+    processes: int = 1,
+) -> tuple[list[Sample], list[float], list[float]]:
+    """Spread ``concurrency`` client threads over ``processes`` processes.
+
+    Returns the samples plus CPU seconds and CPU cores used by each client
+    process. A single Python process tops out near one core, so a value close
+    to 1.0 means the client, not the server, limited throughput.
+    """
+
+    processes = max(1, min(processes, concurrency))
+    shares = [concurrency // processes + (index < concurrency % processes) for index in range(processes)]
+    jobs = [
+        (base_url, mix, share, duration, seed, sum(shares[:index]))
+        for index, share in enumerate(shares)
+    ]
+
+    if processes == 1:
+        outcomes = [drive_process(*jobs[0])]
+    else:
+        with multiprocessing.get_context("spawn").Pool(processes) as pool:
+            outcomes = pool.starmap(drive_process, jobs)
+
+    samples = [sample for outcome in outcomes for sample in outcome[0]]
+    cpu_seconds = [cpu for _, cpu, _ in outcomes]
+    cpu_cores = [cpu / wall if wall else 0.0 for _, cpu, wall in outcomes]
+    return samples, cpu_seconds, cpu_cores
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted sequence."""
+
+    if not sorted_values:
+        return float("nan")
+    rank = min(len(sorted_values), max(1, math.ceil(fraction * len(sorted_values)))) - 1
+    return sorted_values[rank]
+
+
+def status_counts(samples: Sequence[Sample]) -> dict[int, int]:
+    """Count responses per HTTP status, with ``0`` for transport failures."""
+
+    counts: dict[int, int] = {}
+    for sample in samples:
+        counts[sample.status] = counts.get(sample.status, 0) + 1
+    return dict(sorted(counts.items()))
+
+
+def summarize(samples: Sequence[Sample]) -> dict[str, float]:
+    latencies = sorted(sample.latency * 1000 for sample in samples)
+    return {
+        "requests": len(samples),
+        "errors": sum(not sample.ok for sample in samples),
+        "p50_ms": percentile(latencies, 0.50),
+        "p95_ms": percentile(latencies, 0.95),
+        "p99_ms": percentile(latencies, 0.99),
+        "mean_ms": statistics.fmean(latencies) if latencies else float("nan"),
+    }
+
+
+def run_configuration(
+    args: argparse.Namespace,
+    *,
+    workers: int,
+    loader_cache: str,
+    snapshot_dir: Path,
+    log: IO[bytes] | None = None,
+) -> RunResult:
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    process = start_server(
+        port,
+        workers=workers,
+        loader_cache=loader_cache,
+        snapshot_dir=snapshot_dir,
+        log=log,
+    )
+    clients = {
+        "mix": args.mix,
+        "concurrency": args.concurrency,
+        "processes": args.client_processes,
+    }
+    try:
+        wait_until_ready(base_url, process)
+        if "basket" in args.mix and not basket_is_implemented(base_url):
+            print(
+                "Warning: /basket/compute returns 5xx; its failures also drop keep-alive "
+                "connections, inflating errors and latency on other endpoints.",
+                file=sys.stderr,
+            )
+        if args.warmup > 0:
+            drive_clients(base_url, duration=args.warmup, seed=args.seed + 1, **clients)
+
+        sampler = MemorySampler(process.pid, workers)
+        sampler.start()
+        started = time.perf_counter()
+        samples, cpu_seconds, cpu_cores = drive_clients(base_url, duration=args.duration, seed=args.seed, **clients)
+        elapsed = time.perf_counter() - started
+        rss = sampler.stop()
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+    overall = summarize(samples)
+    kinds = sorted({sample.kind for sample in samples})
+    by_kind = {kind: summarize([sample for sample in samples if sample.kind == kind]) for kind in kinds}
+    statuses = {kind: status_counts([sample for sample in samples if sample.kind == kind]) for kind in kinds}
+    return RunResult(
+        workers=workers,
+        loader_cache=loader_cache,
+        points=args.points,
+        concurrency=args.concurrency,
+        client_processes=len(cpu_cores),
+        duration=elapsed,
+        requests=int(overall["requests"]),
+        errors=int(overall["errors"]),
+        throughput=overall["requests"] / elapsed if elapsed else 0.0,
+        p50_ms=overall["p50_ms"],
+        p95_ms=overall["p95_ms"],
+        p99_ms=overall["p99_ms"],
+        client_cpu_seconds=sum(cpu_seconds),
+        client_cpu_peak=max(cpu_cores),
+        worker_rss_mb=rss,
+        by_kind=by_kind,
+        statuses=statuses,
+    )
+
+
+def format_report(results: Sequence[RunResult]) -> str:
+    """Render the comparison table followed by per-endpoint latency breakdowns."""
+
+    header = (
+        f"{'workers':>7} {'cache':<5} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} "
+        f"{'p99 ms':>8} {'requests':>9} {'errors':>7} {'client CPU':>10}  worker RSS MiB (peak)"
+    )
+    lines = [header, "-" * len(header)]
+    saturated = []
+    for result in results:
+        rss = ", ".join(f"{value:.0f}" for value in result.worker_rss_mb) or "n/a"
+        flag = "!" if result.client_cpu_peak >= CLIENT_SATURATION else " "
+        if flag == "!":
+            saturated.append(result)
+        lines.append(
+            f"{result.workers:>7} {result.loader_cache:<5} {result.throughput:>9.1f} "
+            f"{result.p50_ms:>8.1f} {result.p95_ms:>8.1f} {result.p99_ms:>8.1f} "
+            f"{result.requests:>9} {result.errors:>7} {result.client_cpu_peak:>9.2f}{flag}  {rss}"
+        )
+    lines.append(
+        f"client CPU: peak cores used by one client process "
+        f"(host has {os.cpu_count() or '?'} CPUs shared by client and server)"
+    )
+
+    for result in saturated:
+        lines.append(
+            f"Warning: workers={result.workers} cache={result.loader_cache} client process used "
+            f"{result.client_cpu_peak:.2f} cores; the load generator likely limited throughput. "
+            "Raise --client-processes or run the client on another host."
+        )
+
+    for result in results:
+        lines.append("")
+        lines.append(f"workers={result.workers} cache={result.loader_cache}")
+        for kind, stats in result.by_kind.items():
+            statuses = ",".join(
+                f"{status or 'conn'}:{count}" for status, count in result.statuses.get(kind, {}).items()
+            )
+            lines.append(
+                f"  {kind:<13} n={int(stats['requests']):<7} "
+                f"p50={stats['p50_ms']:.1f}ms p95={stats['p95_ms']:.1f}ms p99={stats['p99_ms']:.1f}ms "
+                f"status={statuses}"
+            )
+    return "\n".join(lines)
+
+
+def main() -> int:
+    args = parse_args()
+    print(
+        f"Load test: points={args.points} concurrency={args.concurrency} "
+        f"client_processes={args.client_processes} "
+        f"duration={args.duration:.0f}s mix="
+        + ",".join(f"{kind}={weight:.0%}" for kind, weight in args.mix.items())
+    )
+
+    results: list[RunResult] = []
+    log = args.server_log.open("ab") if args.server_log is not None else None
+    snapshots = tempfile.TemporaryDirectory(prefix="mig-loadtest-")
+    try:
+        snapshot_dir = Path(snapshots.name)
+        write_synthetic_snapshots(snapshot_dir, args.points)
+        for workers in args.workers:
+            for loader_cache in args.loader_cache:
+                label = f"workers={workers} cache={loader_cache}"
+                print(f"Running {label} ...", flush=True)
+                try:
+                    results.append(
+                        run_configuration(
+                            args,
+                            workers=workers,
+                            loader_cache=loader_cache,
+                            snapshot_dir=snapshot_dir,
+                            log=log,
+                        )
+                    )
+                except RuntimeError as exc:
+                    hint = "" if log is not None else " (rerun with --server-log to see uvicorn output)"
+                    print(f"Configuration {label} failed: {exc}{hint}", file=sys.stderr)
+                    return 1
+    finally:
+        snapshots.cleanup()
+        if log is not None:
+            log.close()
+
+    print()
+    print(format_report(results))
+
+    if args.json is not None:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        with args.json.open("w", encoding="utf-8") as fh:
+            json.dump([asdict(result) for result in results], fh, indent=2)
+        print(f"\nSaved results to {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
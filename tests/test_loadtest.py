@@ -0,0 +1,174 @@
+"""Tests for the load-test harness helpers and synthetic app factory."""
+
+from __future__ import annotations
+
+import argparse
+
+import pytest
+from fastapi.testclient import TestClient
+
+from data import sample_series
+from src.backend import loadtest, pricing
+
+
+def test_parse_mix_normalizes_weights():
+    assert loadtest.parse_mix("ratios=3,capabilities=1") == {"ratios": 0.75, "capabilities": 0.25}
+
+
+def test_parse_mix_drops_zero_weights():
+    assert loadtest.parse_mix("ratios=1,basket=0") == {"ratios": 1.0}
+
+
+def test_default_mix_excludes_basket():
+    assert "basket" not in loadtest.parse_mix(loadtest.DEFAULT_MIX)
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["ratios=1,orders=1", "ratios=abc", "ratios=0,capabilities=0", "ratios=2,capabilities=-1"],
+    ids=["unknown-kind", "bad-weight", "zero-total", "negative-weight"],
+)
+def test_parse_mix_rejects_invalid_input(text):
+    with pytest.raises(argparse.ArgumentTypeError):
+        loadtest.parse_mix(text)
+
+
+@pytest.mark.parametrize(
+    "fraction, expected",
+    [(0.0, 1), (0.01, 1), (0.5, 50), (0.95, 95), (0.99, 99), (1.0, 100)],
+)
+def test_percentile_nearest_rank(fraction, expected):
+    values = [float(v) for v in range(1, 101)]
+
+    assert loadtest.percentile(values, fraction) == expected
+
+
+def test_percentile_small_samples():
+    assert loadtest.percentile([5.0], 0.99) == 5.0
+    assert loadtest.percentile([1.0, 2.0, 3.0], 0.5) == 2.0
+    assert loadtest.percentile([1.0, 2.0, 3.0], 0.95) == 3.0
+
+
+def test_percentile_empty_is_nan():
+    value = loadtest.percentile([], 0.5)
+
+    assert value != value
+
+
+def test_summarize_counts_errors_and_transport_failures():
+    samples = [
+        loadtest.Sample("ratios", 0.010, 200),
+        loadtest.Sample("ratios", 0.020, 200),
+        loadtest.Sample("basket", 0.005, 500),
+        loadtest.Sample("ratios", 0.001, 0),
+    ]
+
+    summary = loadtest.summarize(samples)
+
+    assert summary["requests"] == 4
+    assert summary["errors"] == 2
+    assert summary["p50_ms"] == pytest.approx(5.0)
+    assert loadtest.status_counts(samples) == {0: 1, 200: 2, 500: 1}
+
+
+def test_install_rejects_unknown_loader_cache_mode(tmp_path):
+    with pytest.raises(ValueError):
+        loadtest.install_snapshot_loaders(tmp_path, loader_cache="static")
+
+
+def test_synthetic_snapshots_load_through_sample_series(tmp_path):
+    loadtest.write_synthetic_snapshots(tmp_path, 10)
+
+    for filename, _, _ in loadtest.SYNTHETIC_SNAPSHOTS:
+        points = sample_series.load_snapshot(tmp_path / filename)
+        assert len(points) == 10
+        assert all(point.value > 0 for point in points)
+
+
+@pytest.fixture
+def restore_loaders():
+    names = [name for _, name, _ in loadtest.SYNTHETIC_SNAPSHOTS]
+    saved_loaders = {name: getattr(pricing, name) for name in names}
+    saved_dir = sample_series.SNAPSHOT_DIR
+    yield
+    for name, loader in saved_loaders.items():
+        setattr(pricing, name, loader)
+        getattr(sample_series, name).cache_clear()
+    sample_series.SNAPSHOT_DIR = saved_dir
+
+
+@pytest.mark.parametrize("mode", loadtest.LOADER_CACHE_MODES)
+def test_create_app_serves_synthetic_snapshots(monkeypatch, restore_loaders, mode):
+    monkeypatch.delenv(loadtest.SNAPSHOT_DIR_ENV, raising=False)
+    monkeypatch.setenv(loadtest.POINTS_ENV, "25")
+    monkeypatch.setenv(loadtest.LOADER_CACHE_ENV, mode)
+
+    client = TestClient(loadtest.create_app())
+
+    for path in loadtest.RATIO_PATHS:
+        response = client.get(path)
+        assert response.status_code == 200, path
+        assert len(response.json()["points"]) == 25, path
+
+    assert client.get("/metadata/capabilities").status_code == 200
+
+
+@pytest.mark.parametrize("mode, expected_points", [("on", 25), ("off", 5)])
+def test_loader_cache_toggles_app_snapshot_cache(monkeypatch, restore_loaders, tmp_path, mode, expected_points):
+    loadtest.write_synthetic_snapshots(tmp_path, 25)
+    monkeypatch.setenv(loadtest.SNAPSHOT_DIR_ENV, str(tmp_path))
+    monkeypatch.setenv(loadtest.LOADER_CACHE_ENV, mode)
+    client = TestClient(loadtest.create_app())
+    assert len(client.get("/ratios/gold-usd").json()["points"]) == 25
+
+    # Rewrite the snapshot: only the uncached loader should see the change.
+    loadtest.write_synthetic_snapshots(tmp_path, 5)
+
+    assert len(client.get("/ratios/gold-usd").json()["points"]) == expected_points
+
+
+def make_result(client_cpu_peak: float) -> loadtest.RunResult:
+    return loadtest.RunResult(
+        workers=1,
+        loader_cache="on",
+        points=10,
+        concurrency=4,
+        client_processes=1,
+        duration=1.0,
+        requests=10,
+        errors=0,
+        throughput=10.0,
+        p50_ms=1.0,
+        p95_ms=2.0,
+        p99_ms=3.0,
+        client_cpu_seconds=client_cpu_peak,
+        client_cpu_peak=client_cpu_peak,
+    )
+
+
+def test_report_warns_when_client_is_saturated():
+    assert "Warning" not in loadtest.format_report([make_result(0.3)])
+
+    report = loadtest.format_report([make_result(0.95)])
+
+    assert "0.95!" in report
+    assert "Warning: workers=1 cache=on client process used 0.95 cores" in report
+
+
+def test_drive_clients_reports_cpu_for_each_process(monkeypatch):
+    calls = []
+
+    def fake_drive(base_url, mix, concurrency, duration, seed, first_client):
+        calls.append((concurrency, first_client))
+        return [loadtest.Sample("ratios", 0.01, 200)] * concurrency, 0.5, 1.0
+
+    monkeypatch.setattr(loadtest, "drive_process", fake_drive)
+
+    samples, cpu_seconds, cpu_cores = loadtest.drive_clients(
+        "http://unused", mix={"ratios": 1.0}, concurrency=5, duration=1.0, seed=0
+    )
+
+    assert calls == [(5, 0)]
+    assert len(samples) == 5
+    assert cpu_seconds == [0.5]
+    assert cpu_cores == [0.5]
@@ -0,0 +1,274 @@
+"""Tests for the concurrent data refresh, run against local stub HTTP servers."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from data.refresh import build_sources, refresh, validate_observations
+
+
+def fred_body(values: list[str], dates: list[str] | None = None) -> bytes:
+    dates = dates or [f"2024-01-{day:02d}" for day in range(1, len(values) + 1)]
+    observations = [{"date": d, "value": v} for d, v in zip(dates, values)]
+    return json.dumps({"observations": observations}).encode()
+
+
+def stooq_body(closes: list[str], dates: list[str] | None = None) -> bytes:
+    dates = dates or [f"2024-01-{day:02d}" for day in range(1, len(closes) + 1)]
+    lines = ["Date,Open,High,Low,Close"]
+    lines += [f"{d},1,1,1,{c}" for d, c in zip(dates, closes)]
+    return ("\n".join(lines) + "\n").encode()
+
+
+GOOD_FRED = fred_body(["4700.5", "4710.1", "4695.0"])
+GOOD_STOOQ = stooq_body(["2050.1", "2061.4", "2044.9"])
+
+
+class StubServer:
+    """Serve a fixed body per path, optionally delayed, failing or trickled."""
+
+    def __init__(self) -> None:
+        self.routes: dict[str, dict] = {}
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                route = stub.routes[self.path.split("?")[0]]
+                route["hits"] += 1
+                time.sleep(route["delay"])
+                self.send_response(route["status"])
+                self.send_header("Content-Length", str(len(route["body"])))
+                self.end_headers()
+                try:
+                    if route["trickle"]:
+                        for byte in route["body"]:
+                            self.wfile.write(bytes([byte]))
+                            self.wfile.flush()
+                            time.sleep(route["trickle"])
+                    else:
+                        self.wfile.write(route["body"])
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def route(
+        self,
+        path: str,
+        body: bytes,
+        *,
+        status: int = 200,
+        delay: float = 0.0,
+        trickle: float = 0.0,
+    ) -> str:
+        self.routes[path] = {"body": body, "status": status, "delay": delay, "trickle": trickle, "hits": 0}
+        return f"http://127.0.0.1:{self.server.server_port}{path}"
+
+    def hits(self, path: str) -> int:
+        return self.routes[path]["hits"]
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def stub():
+    server = StubServer()
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def published(tmp_path: Path) -> Path:
+    output_dir = tmp_path / "data"
+    output_dir.mkdir()
+    (output_dir / "sp500.json").write_text('{"series_id": "SP500", "observations": []}')
+    (output_dir / "xauusd.json").write_text('{"series_id": "XAUUSD_STOOQ", "observations": []}')
+    return output_dir
+
+
+def snapshot(output_dir: Path) -> dict[str, bytes]:
+    return {path.name: path.read_bytes() for path in sorted(output_dir.iterdir())}
+
+
+def sources_for(fred_url: str, stooq_url: str):
+    args = argparse.Namespace(
+        api_key="test-key",
+        fred_url=fred_url,
+        fred_series_id="SP500",
+        fred_start_date="2024-01-01",
+        stooq_url=stooq_url,
+    )
+    return build_sources(args)
+
+
+def test_refresh_publishes_all_sources_concurrently(stub, published):
+    stooq_url = stub.route("/stooq", GOOD_STOOQ, delay=0.4)
+    sources = sources_for(stub.route("/fred", GOOD_FRED, delay=0.4), stooq_url)
+
+    started = time.perf_counter()
+    results, ok = refresh(sources, published, retries=0)
+    elapsed = time.perf_counter() - started
+
+    assert ok
+    assert all(result.ok for result in results)
+    assert elapsed < 0.75, "sources should be fetched concurrently"
+
+    sp500 = json.loads((published / "sp500.json").read_text())
+    gold = json.loads((published / "xauusd.json").read_text())
+    assert [row["value"] for row in sp500["observations"]] == ["4700.5", "4710.1", "4695.0"]
+    assert [row["value"] for row in gold["observations"]] == [2050.1, 2061.4, 2044.9]
+    assert gold["url"] == stooq_url
+    assert sorted(path.name for path in published.iterdir()) == ["sp500.json", "xauusd.json"]
+
+
+def test_failed_required_source_leaves_published_files_untouched(stub, published):
+    before = snapshot(published)
+    sources = sources_for(
+        stub.route("/fred", GOOD_FRED),
+        stub.route("/stooq", b"boom", status=500),
+    )
+
+    results, ok = refresh(sources, published, retries=1, backoff=0.01)
+
+    assert not ok
+    failed = {result.spec.name: result for result in results if not result.ok}
+    assert list(failed) == ["XAUUSD_STOOQ"]
+    assert failed["XAUUSD_STOOQ"].attempts == 2
+    assert stub.hits("/stooq") == 2
+    assert snapshot(published) == before
+
+
+@pytest.mark.parametrize(
+    "body, message",
+    [
+        (stooq_body(["2050", "2051"], dates=["2024-01-02", "2024-01-01"]), "not after previous"),
+        (stooq_body(["2050", "nan", "2051"]), "invalid value"),
+        (stooq_body(["2050", "9000"]), "jump of"),
+    ],
+    ids=["non-increasing-dates", "nan", "jump"],
+)
+def test_validation_failure_aborts_without_retry(stub, published, body, message):
+    before = snapshot(published)
+    sources = sources_for(stub.route("/fred", GOOD_FRED), stub.route("/stooq", body))
+
+    results, ok = refresh(sources, published, retries=2, backoff=0.01)
+
+    assert not ok
+    gold = next(result for result in results if result.spec.name == "XAUUSD_STOOQ")
+    assert gold.error is not None and message in gold.error
+    assert gold.attempts == 1
+    assert stub.hits("/stooq") == 1
+    assert snapshot(published) == before
+
+
+def test_deadline_bounds_a_trickling_source(stub, published):
+    before = snapshot(published)
+    sources = sources_for(
+        stub.route("/fred", GOOD_FRED),
+        # Each byte arrives well within the socket timeout, but the body as a
+        # whole would take far longer than the deadline.
+        stub.route("/stooq", GOOD_STOOQ, trickle=0.05),
+    )
+
+    started = time.perf_counter()
+    results, ok = refresh(sources, published, timeout=5.0, retries=0, deadline=0.5)
+    elapsed = time.perf_counter() - started
+
+    assert not ok
+    assert elapsed < 1.5
+    gold = next(result for result in results if result.spec.name == "XAUUSD_STOOQ")
+    assert gold.error is not None and gold.error.startswith("timed out")
+    assert gold.attempts == 1
+    assert snapshot(published) == before
+
+
+def test_missing_api_key_fails_fred_source(stub, published):
+    sources = build_sources(
+        argparse.Namespace(
+            api_key=None,
+            fred_url=stub.route("/fred", GOOD_FRED),
+            fred_series_id="SP500",
+            fred_start_date="2024-01-01",
+            stooq_url=stub.route("/stooq", GOOD_STOOQ),
+        )
+    )
+
+    results, ok = refresh(sources, published, retries=0)
+
+    assert not ok
+    assert "FRED API key not provided" in (results[0].error or "")
+    assert stub.hits("/fred") == 0
+
+
+def rows(*values: object) -> list[dict[str, object]]:
+    return [{"date": f"2024-01-{day:02d}", "value": value} for day, value in enumerate(values, start=1)]
+
+
+def test_validate_accepts_sane_series():
+    assert validate_observations(rows("100", 101.5, "99.25"), max_jump=1.0) == []
+
+
+def test_validate_rejects_empty_series():
+    assert validate_observations([], max_jump=1.0) == ["no observations"]
+
+
+@pytest.mark.parametrize("bad", [0, "0", -5.0, "-1", float("inf"), "NaN"])
+def test_validate_rejects_non_positive_and_non_finite_values(bad):
+    problems = validate_observations(rows(100, bad, 100), max_jump=1.0)
+
+    assert len(problems) == 1
+    assert "invalid value" in problems[0]
+
+
+@pytest.mark.parametrize(
+    "row",
+    [
+        {"date": "2024-01-02", "value": "."},
+        {"date": "2024-01-02", "value": None},
+        {"date": "2024-01-02"},
+        {"date": "02/01/2024", "value": "100"},
+        {"value": "100"},
+    ],
+)
+def test_validate_reports_unparseable_rows(row):
+    series = [{"date": "2024-01-01", "value": "100"}, row, {"date": "2024-01-03", "value": "101"}]
+
+    problems = validate_observations(series, max_jump=1.0)
+
+    assert len(problems) == 1
+    assert "unparseable observation" in problems[0]
+
+
+def test_validate_rejects_duplicate_dates():
+    series = [{"date": "2024-01-01", "value": 1}, {"date": "2024-01-01", "value": 1}]
+
+    assert validate_observations(series, max_jump=1.0) == ["2024-01-01: date not after previous 2024-01-01"]
+
+
+@pytest.mark.parametrize(
+    "values, expected",
+    [
+        ((100, 200), 0),
+        ((100, 201), 1),
+        ((100, 50), 0),
+        ((100, 49), 1),
+    ],
+    ids=["double", "above-double", "halve", "below-half"],
+)
+def test_validate_jump_is_symmetric(values, expected):
+    assert len(validate_observations(rows(*values), max_jump=1.0)) == expected
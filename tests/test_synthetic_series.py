@@ -0,0 +1,46 @@
+"""Tests for the deterministic synthetic series generator."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+import pytest
+
+from data.synthetic_series import generate_series
+
+
+def test_same_seed_gives_identical_series():
+    assert generate_series(50, initial=100.0, seed=7) == generate_series(50, initial=100.0, seed=7)
+
+
+def test_different_seeds_diverge():
+    first = generate_series(50, initial=100.0, seed=1)
+    second = generate_series(50, initial=100.0, seed=2)
+
+    assert first[0].value == second[0].value == 100.0
+    assert [p.value for p in first] != [p.value for p in second]
+
+
+def test_series_share_daily_timestamps():
+    start = date(2000, 1, 1)
+    sp500 = generate_series(30, initial=1400.0, start=start, seed=1)
+    gold = generate_series(30, initial=280.0, start=start, seed=2)
+
+    assert [p.timestamp for p in sp500] == [p.timestamp for p in gold]
+    assert [p.timestamp for p in sp500] == [start + timedelta(days=i) for i in range(30)]
+
+
+def test_values_stay_positive():
+    series = generate_series(2000, initial=10.0, volatility=0.05, seed=3)
+
+    assert len(series) == 2000
+    assert all(point.value > 0 for point in series)
+
+
+def test_zero_points_gives_empty_series():
+    assert generate_series(0, initial=100.0) == []
+
+
+def test_negative_points_rejected():
+    with pytest.raises(ValueError):
+        generate_series(-1, initial=100.0)